@@ -4,31 +4,299 @@ Oracle Object Storage File Transfer Application
 Transfers files from local directory to Oracle Cloud Infrastructure Object Storage
 """
 
+import io
 import os
 import sys
+import csv
+import math
+import stat
+import time
+import shutil
+import json
+import socket
+import socketserver
+import mmap
+import queue
+import atexit
+import threading
+import contextlib
 import logging
+import logging.handlers
+import functools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from datetime import datetime
-import oci
-from oci.object_storage import ObjectStorageClient
 import argparse
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('file_transfer.log'),
-        logging.StreamHandler()
-    ]
-)
+# The OCI SDK is imported inside the functions that use it rather than here:
+# loading it is slow, and the 'client' action only talks to a local daemon
+
+# Configure logging; records are handed to a background listener thread so
+# file and console I/O stay off the transfer threads
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.handlers.RotatingFileHandler(
+        'file_transfer.log', maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+    ),
+    logging.StreamHandler()
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)
+log_level = (os.getenv('LOG_LEVEL') or 'INFO').upper()
+log_level_valid = log_level in logging.getLevelNamesMapping()
+logging.root.setLevel(log_level if log_level_valid else logging.INFO)
+logging.root.addHandler(logging.handlers.QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
+if not log_level_valid:
+    logger.warning(f"Invalid LOG_LEVEL {log_level!r}, using INFO")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+# Adaptive concurrency starts here and is re-evaluated every sample interval
+ADAPTIVE_INITIAL_CONCURRENCY = 4
+ADAPTIVE_SAMPLE_INTERVAL = 2.0
+# Relative throughput drop treated as a regression rather than noise
+ADAPTIVE_TOLERANCE = 0.05
+# Samples after which a learned ceiling is raised one step so it can recover
+ADAPTIVE_CEILING_DECAY_SAMPLES = 5
+
+# Files at or above this size are uploaded as parallel multipart uploads
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+# Object Storage allows at most 10000 parts per multipart upload
+MULTIPART_MAX_PARTS = 10000
+
+# Objects at or above this size are downloaded as parallel ranged GETs
+RANGED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+RANGED_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Read size used when streaming response bodies to disk
+DOWNLOAD_STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Page size requested from list_objects (the service maximum)
+LIST_PAGE_SIZE = 1000
+
+# Unix socket used by the daemon and client actions
+DEFAULT_SOCKET_PATH = '/tmp/oci-file-transfer.sock'
+
+# Connection pool sizing for the client's HTTP session; the urllib3 default of
+# 10 connections per host would cap the effective transfer concurrency
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+
+def _oci_errors() -> tuple:
+    """Errors raised by the OCI client: service responses and transport failures"""
+    import oci
+    return (oci.exceptions.ServiceError, oci.exceptions.RequestException)
+
+
+def _download_errors() -> tuple:
+    """
+    Errors that mark a failed download
+    
+    Downloads read the raw urllib3 response, which raises its own errors
+    mid-stream; OSError covers local write failures and short bodies.
+    """
+    from oci._vendor.urllib3.exceptions import HTTPError
+    return _oci_errors() + (HTTPError, OSError)
+
+
+@functools.lru_cache(maxsize=None)
+def get_object_storage_client(config_file: str, profile: str) -> 'oci.object_storage.ObjectStorageClient':
+    """
+    Return a shared Object Storage client for an OCI config file and profile
+    
+    Clients are cached for the lifetime of the process so that repeated
+    uploaders reuse the same HTTP session and connection pool.
+    
+    Args:
+        config_file: Path to the OCI config file
+        profile: OCI config profile name
+    """
+    import oci
+    from oci._vendor.requests.adapters import HTTPAdapter
+    
+    oci_config = oci.config.from_file(file_location=config_file, profile_name=profile)
+    
+    client = oci.object_storage.ObjectStorageClient(oci_config)
+    client.base_client.session.mount(
+        'https://',
+        HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    )
+    return client
+
+
+def _walk(root: str, relative_parts: tuple = ()):
+    """
+    Recursively yield (path, relative_parts, size) for every file under root
+    
+    Uses os.scandir so each entry's type and size come from a single cached
+    stat instead of repeated Path.is_file()/stat() calls. relative_parts holds
+    the path components below the original root, ready for building object names.
+    Directories and files that cannot be read, or that change during the
+    walk, are skipped with a warning.
+    
+    Args:
+        root: Directory to walk
+        relative_parts: Path components of root relative to the top-level directory
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        # Unreadable, or removed/replaced since its parent was listed
+        logger.warning(f"Skipping directory {root}: {e}")
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path, relative_parts + (entry.name,))
+            elif entry.is_file():
+                try:
+                    size = entry.stat().st_size
+                except OSError as e:
+                    # Removed or made inaccessible between listing and stat
+                    logger.warning(f"Skipping file {entry.path}: {e}")
+                    continue
+                yield entry.path, relative_parts + (entry.name,), size
+
+
+class _MemoryviewReader(io.RawIOBase):
+    """Read-only file object over a memoryview, used to send mmap slices without buffering them"""
+    
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._position = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def readinto(self, buffer):
+        count = min(len(buffer), len(self._view) - self._position)
+        buffer[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, offset)
+        return self._position
+    
+    def tell(self):
+        return self._position
+
+
+class _RequestSlots:
+    """
+    Resizable limit on storage requests in flight across all transfers
+    
+    File uploads, multipart parts and ranged GETs each hold a slot only for the
+    duration of their own request, so waiting on other work never holds one.
+    """
+    
+    def __init__(self, limit: int):
+        self._condition = threading.Condition()
+        self._limit = max(1, limit)
+        self._active = 0
+    
+    def set_limit(self, limit: int):
+        with self._condition:
+            self._limit = max(1, limit)
+            self._condition.notify_all()
+    
+    @contextlib.contextmanager
+    def slot(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify()
+
+
+class _ConcurrencyController:
+    """
+    Hill-climbing concurrency tuner driven by measured throughput
+    
+    Bytes completed are sampled every ADAPTIVE_SAMPLE_INTERVAL seconds. After
+    each sample the concurrency moves by a factor of sqrt(2) in the current
+    direction; when throughput drops compared with the previous sample the
+    direction reverses, and a drop after an increase sets a ceiling at the
+    previous level. Throughput is measured from completed files, so a single
+    window can be noisy: the ceiling is therefore temporary and is raised one
+    sqrt(2) step every ADAPTIVE_CEILING_DECAY_SAMPLES samples until it is back
+    at the maximum, letting the controller probe upwards again. Not
+    thread-safe: record() is called from the thread that submits the transfers.
+    """
+    
+    def __init__(self, maximum: int, initial: int = ADAPTIVE_INITIAL_CONCURRENCY):
+        self.maximum = max(1, maximum)
+        self.ceiling = self.maximum
+        self.current_cc = min(max(1, initial), self.maximum)
+        self.samples = deque(maxlen=32)
+        self._direction = 1
+        self._samples_since_ceiling = 0
+        self._window_bytes = 0
+        self._window_start = time.monotonic()
+    
+    def record(self, nbytes: int):
+        """Account for a completed transfer and re-tune once the sample interval elapses"""
+        self._window_bytes += nbytes
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed < ADAPTIVE_SAMPLE_INTERVAL:
+            return
+        
+        throughput = self._window_bytes / elapsed
+        if self.samples:
+            _, previous_cc, previous_throughput = self.samples[-1]
+            if throughput < previous_throughput * (1 - ADAPTIVE_TOLERANCE):
+                if self._direction > 0 and previous_cc < self.current_cc:
+                    self.ceiling = previous_cc
+                    self._samples_since_ceiling = 0
+                self._direction = -self._direction
+        self.samples.append((now, self.current_cc, throughput))
+        
+        if self.ceiling < self.maximum:
+            self._samples_since_ceiling += 1
+            if self._samples_since_ceiling >= ADAPTIVE_CEILING_DECAY_SAMPLES:
+                self.ceiling = min(self.maximum, max(self.ceiling + 1, round(self.ceiling * math.sqrt(2))))
+                self._samples_since_ceiling = 0
+        
+        factor = math.sqrt(2) if self._direction > 0 else 1 / math.sqrt(2)
+        adjusted = round(self.current_cc * factor)
+        if adjusted == self.current_cc:
+            adjusted += self._direction
+        new_cc = min(max(1, adjusted), self.ceiling)
+        if new_cc != self.current_cc:
+            logger.debug(f"Concurrency {self.current_cc} -> {new_cc} ({throughput / 1e6:.1f} MB/s)")
+        self.current_cc = new_cc
+        
+        self._window_bytes = 0
+        self._window_start = now
 
 
 class OracleObjectStorageUploader:
     """Handles file uploads to Oracle Object Storage"""
     
-    def __init__(self, config: dict, namespace: str, bucket_name: str):
+    def __init__(self, config: dict, namespace: str, bucket_name: str,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, assume_exists: bool = False,
+                 adaptive_concurrency: bool = False):
         """
         Initialize Oracle Object Storage uploader
         
@@ -36,25 +304,41 @@ class OracleObjectStorageUploader:
             config: OCI configuration dictionary (from ~/.oci/config file)
             namespace: Oracle Cloud Object Storage namespace
             bucket_name: Name of the bucket
+            max_concurrency: Maximum number of parallel transfers
+            assume_exists: Skip the get_bucket round trip that verifies the bucket
+            adaptive_concurrency: Tune directory upload concurrency from measured
+                throughput, using max_concurrency as the upper bound
         """
         try:
-            # Initialize OCI config
-            oci_config = oci.config.from_file(
-                file_location=config.get('config_file', os.path.expanduser('~/.oci/config')),
-                profile_name=config.get('profile', 'DEFAULT')
+            self.object_storage_client = get_object_storage_client(
+                config.get('config_file', os.path.expanduser('~/.oci/config')),
+                config.get('profile', 'DEFAULT')
             )
-            
-            self.object_storage_client = ObjectStorageClient(oci_config)
             self.namespace = namespace
             self.bucket_name = bucket_name
+            self.max_concurrency = max(1, max_concurrency)
+            self.adaptive_concurrency = adaptive_concurrency
+            # One request budget and one part pool shared by every transfer, so
+            # multipart uploads inside a directory upload do not multiply the
+            # number of requests in flight
+            self._request_slots = _RequestSlots(self.max_concurrency)
+            self._part_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix='upload-part'
+            )
             
             # Verify connection by accessing bucket properties
-            self.object_storage_client.get_bucket(
-                namespace_name=namespace,
-                bucket_name=bucket_name
-            )
-            logger.info(f"Connected to Oracle Object Storage bucket: {bucket_name} in namespace: {namespace}")
-        except oci.exceptions.OciError as e:
+            if assume_exists:
+                logger.info(
+                    f"Using Oracle Object Storage bucket: {bucket_name} in namespace: {namespace} "
+                    f"(existence not verified)"
+                )
+            else:
+                self.object_storage_client.get_bucket(
+                    namespace_name=namespace,
+                    bucket_name=bucket_name
+                )
+                logger.info(f"Connected to Oracle Object Storage bucket: {bucket_name} in namespace: {namespace}")
+        except _oci_errors() as e:
             logger.error(f"Failed to connect to Oracle Object Storage: {e}")
             raise
     
@@ -71,31 +355,131 @@ class OracleObjectStorageUploader:
         """
         local_path = Path(local_file_path)
         
-        if not local_path.exists():
+        # A single stat covers the existence, type and size checks
+        try:
+            file_stat = local_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"File not found: {local_file_path}")
             return False
         
-        if not local_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             logger.error(f"Path is not a file: {local_file_path}")
             return False
         
-        object_name = object_name or local_path.name
+        return self._put_file(local_path, object_name or local_path.name, file_stat.st_size)
+    
+    def _put_file(self, local_path: Path, object_name: str, file_size: int):
+        """
+        Upload a file whose size is already known
         
+        Args:
+            local_path: Path to local file
+            object_name: Name for the object
+            file_size: Size of the file in bytes
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
         try:
-            with open(local_path, 'rb') as file_content:
-                self.object_storage_client.put_object(
-                    namespace_name=self.namespace,
-                    bucket_name=self.bucket_name,
-                    object_name=object_name,
-                    put_object_body=file_content
-                )
-            file_size = local_path.stat().st_size
-            logger.info(f"Successfully uploaded: {local_file_path} -> {object_name} ({file_size} bytes)")
+            if file_size >= MULTIPART_THRESHOLD:
+                self._upload_multipart(local_path, object_name, file_size)
+            else:
+                with open(local_path, 'rb') as file_content:
+                    # Start kernel readahead of the whole file so disk reads
+                    # overlap with connection setup and the request send
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(file_content.fileno(), 0, file_size, os.POSIX_FADV_WILLNEED)
+                    with self._request_slots.slot():
+                        self.object_storage_client.put_object(
+                            namespace_name=self.namespace,
+                            bucket_name=self.bucket_name,
+                            object_name=object_name,
+                            put_object_body=file_content,
+                            content_length=file_size
+                        )
+            logger.debug(f"Successfully uploaded: {local_path} -> {object_name} ({file_size} bytes)")
             return True
-        except oci.exceptions.OciError as e:
-            logger.error(f"Failed to upload {local_file_path}: {e}")
+        except _oci_errors() + (OSError,) as e:
+            # OSError covers files removed or made unreadable after they were found
+            logger.error(f"Failed to upload {local_path}: {e}")
             return False
     
+    def _upload_multipart(self, local_path: Path, object_name: str, file_size: int):
+        """
+        Upload a large file as a multipart upload with parts sent in parallel
+        
+        Args:
+            local_path: Path to local file
+            object_name: Name for the object
+            file_size: Size of the file in bytes
+        """
+        from oci.object_storage.models import (
+            CommitMultipartUploadDetails,
+            CommitMultipartUploadPartDetails,
+            CreateMultipartUploadDetails,
+        )
+        
+        part_size = max(MULTIPART_PART_SIZE, -(-file_size // MULTIPART_MAX_PARTS))
+        upload_id = self.object_storage_client.create_multipart_upload(
+            namespace_name=self.namespace,
+            bucket_name=self.bucket_name,
+            create_multipart_upload_details=CreateMultipartUploadDetails(object=object_name)
+        ).data.upload_id
+        
+        try:
+            # Parts are read straight from the page cache through the mapping,
+            # so no part-sized buffer is held per in-flight request
+            with open(local_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+                
+                def upload_part(part_num: int):
+                    start = (part_num - 1) * part_size
+                    end = min(start + part_size, file_size)
+                    with memoryview(file_map)[start:end] as part_view, self._request_slots.slot():
+                        response = self.object_storage_client.upload_part(
+                            namespace_name=self.namespace,
+                            bucket_name=self.bucket_name,
+                            object_name=object_name,
+                            upload_id=upload_id,
+                            upload_part_num=part_num,
+                            upload_part_body=_MemoryviewReader(part_view),
+                            content_length=end - start
+                        )
+                    return CommitMultipartUploadPartDetails(
+                        part_num=part_num,
+                        etag=response.headers['etag']
+                    )
+                
+                part_count = -(-file_size // part_size)
+                futures = [
+                    self._part_executor.submit(upload_part, part_num)
+                    for part_num in range(1, part_count + 1)
+                ]
+                try:
+                    parts = [future.result() for future in futures]
+                except Exception:
+                    # Drop queued parts and wait for running ones before unmapping
+                    for future in futures:
+                        future.cancel()
+                    wait(futures)
+                    raise
+            
+            self.object_storage_client.commit_multipart_upload(
+                namespace_name=self.namespace,
+                bucket_name=self.bucket_name,
+                object_name=object_name,
+                upload_id=upload_id,
+                commit_multipart_upload_details=CommitMultipartUploadDetails(parts_to_commit=parts)
+            )
+        except Exception:
+            self.object_storage_client.abort_multipart_upload(
+                namespace_name=self.namespace,
+                bucket_name=self.bucket_name,
+                object_name=object_name,
+                upload_id=upload_id
+            )
+            raise
+    
     def upload_directory(self, local_dir_path: str, object_prefix: str = ""):
         """
         Upload all files from a directory to Oracle Object Storage
@@ -124,45 +508,114 @@ class OracleObjectStorageUploader:
             'files': []
         }
         
-        files = list(local_dir.glob('**/*'))
-        logger.info(f"Found {len([f for f in files if f.is_file()])} files to upload in {local_dir_path}")
+        logger.info(f"Uploading files from {local_dir_path}")
         
-        for file_path in files:
-            if file_path.is_file():
-                # Create object name with directory structure
-                relative_path = file_path.relative_to(local_dir)
-                object_name = f"{object_prefix}/{relative_path}".lstrip('/').replace('\\', '/')
-                
-                if self.upload_file(str(file_path), object_name):
-                    stats['success_count'] += 1
-                    stats['total_size'] += file_path.stat().st_size
-                    stats['files'].append({
-                        'local_path': str(file_path),
-                        'object_name': object_name,
-                        'size': file_path.stat().st_size
-                    })
-                else:
-                    stats['failed_count'] += 1
+        # Object names are prefix segments joined with the relative path segments
+        prefix_parts = tuple(part for part in object_prefix.split('/') if part)
+        
+        # With adaptive concurrency the pool is sized for the upper bound and
+        # the number of uploads in flight follows the controller
+        controller = _ConcurrencyController(self.max_concurrency) if self.adaptive_concurrency else None
+        
+        def record(future):
+            file_path, object_name, size, success = future.result()
+            if success:
+                if controller:
+                    controller.record(size)
+                    self._request_slots.set_limit(controller.current_cc)
+                stats['success_count'] += 1
+                stats['total_size'] += size
+                stats['files'].append({
+                    'local_path': file_path,
+                    'object_name': object_name,
+                    'size': size
+                })
+            else:
+                stats['failed_count'] += 1
+        
+        # Files are submitted as the walk finds them, keeping a bounded number
+        # in flight so uploads start immediately and memory stays flat
+        pending = set()
+        
+        # The controller also sizes the shared request budget, so multipart
+        # parts follow it as well
+        if controller:
+            self._request_slots.set_limit(controller.current_cc)
+        
+        # The OCI client is safe to share across threads for issuing requests
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                for file_path, relative_parts, size in _walk(str(local_dir)):
+                    # Re-read the limit after every completion; record() may lower it
+                    while len(pending) >= (controller.current_cc if controller else self.max_concurrency * 2):
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record(future)
+                    pending.add(executor.submit(
+                        self._upload_one, file_path, '/'.join(prefix_parts + relative_parts), size
+                    ))
+                for future in as_completed(pending):
+                    record(future)
+        finally:
+            if controller:
+                self._request_slots.set_limit(self.max_concurrency)
         
         return stats
     
-    def list_objects(self, object_prefix: str = ""):
+    def _upload_one(self, file_path: str, object_name: str, size: int):
+        """
+        Upload a single file from a directory upload
+        
+        Returns:
+            tuple: (file_path, object_name, size, success)
+        """
+        # The walk already stat'ed the file, so skip straight to the upload
+        return file_path, object_name, size, self._put_file(Path(file_path), object_name, size)
+    
+    def list_objects(self, object_prefix: str = "", output_csv: str = None):
         """
         List all objects in the bucket
         
+        Objects are fetched a page at a time and written to stdout (or a CSV
+        file) in one write per page, with a single log record per page.
+        
         Args:
             object_prefix: Optional prefix to filter objects
+            output_csv: Optional path to write the listing as CSV (name,size)
         """
+        import oci
+        
         try:
-            objects = self.object_storage_client.list_objects(
-                namespace_name=self.namespace,
-                bucket_name=self.bucket_name,
-                prefix=object_prefix if object_prefix else None
-            )
-            logger.info(f"Objects in bucket '{self.bucket_name}':")
-            for obj in objects.data.objects:
-                logger.info(f"  - {obj.name} ({obj.size} bytes)")
-        except oci.exceptions.OciError as e:
+            output = open(output_csv, 'w', newline='') if output_csv else sys.stdout
+            try:
+                writer = csv.writer(output) if output_csv else None
+                if writer:
+                    writer.writerow(['name', 'size'])
+                
+                logger.info(f"Objects in bucket '{self.bucket_name}':")
+                total = 0
+                pages = oci.pagination.list_call_get_all_results_generator(
+                    self.object_storage_client.list_objects,
+                    'response',
+                    namespace_name=self.namespace,
+                    bucket_name=self.bucket_name,
+                    prefix=object_prefix if object_prefix else None,
+                    limit=LIST_PAGE_SIZE,
+                    # Only the fields that are printed; size is not returned by default
+                    fields='name,size'
+                )
+                for page in pages:
+                    objects = page.data.objects
+                    if writer:
+                        writer.writerows((obj.name, obj.size) for obj in objects)
+                    else:
+                        output.write(''.join(f"  - {obj.name} ({obj.size} bytes)\n" for obj in objects))
+                    total += len(objects)
+                    logger.info(f"Listed page of {len(objects)} objects ({total} total)")
+            finally:
+                if output_csv:
+                    output.close()
+        except _oci_errors() as e:
             logger.error(f"Failed to list objects: {e}")
     
     def download_file(self, object_name: str, local_file_path: str):
@@ -176,23 +629,207 @@ class OracleObjectStorageUploader:
         Returns:
             bool: True if successful, False otherwise
         """
+        local_path = Path(local_file_path)
+        
         try:
-            response = self.object_storage_client.get_object(
+            head = self.object_storage_client.head_object(
                 namespace_name=self.namespace,
                 bucket_name=self.bucket_name,
                 object_name=object_name
             )
+            object_size = int(head.headers['content-length'])
+            etag = head.headers['etag']
             
-            Path(local_file_path).parent.mkdir(parents=True, exist_ok=True)
+            local_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(local_file_path, 'wb') as file:
-                file.write(response.data.content)
+            if object_size >= RANGED_DOWNLOAD_THRESHOLD:
+                self._download_ranges(object_name, local_file_path, object_size, etag)
+            else:
+                response = self.object_storage_client.get_object(
+                    namespace_name=self.namespace,
+                    bucket_name=self.bucket_name,
+                    object_name=object_name,
+                    if_match=etag
+                )
+                try:
+                    with open(local_file_path, 'wb') as file:
+                        shutil.copyfileobj(response.data.raw, file, DOWNLOAD_STREAM_CHUNK_SIZE)
+                        # The vendored urllib3 does not enforce Content-Length
+                        if file.tell() != object_size:
+                            raise ConnectionError(
+                                f"Body ended after {file.tell()} of {object_size} bytes"
+                            )
+                except Exception:
+                    # Do not leave a truncated file behind
+                    local_path.unlink(missing_ok=True)
+                    raise
             
-            logger.info(f"Successfully downloaded: {object_name} -> {local_file_path}")
+            logger.debug(f"Successfully downloaded: {object_name} -> {local_file_path}")
             return True
-        except oci.exceptions.OciError as e:
+        except _download_errors() as e:
             logger.error(f"Failed to download {object_name}: {e}")
             return False
+    
+    def _download_ranges(self, object_name: str, local_file_path: str, object_size: int, etag: str):
+        """
+        Download an object with parallel ranged GETs written in place with pwrite
+        
+        Every range is conditional on the ETag, so an object overwritten during
+        the download fails the request instead of mixing two versions.
+        
+        Args:
+            object_name: Name of the object
+            local_file_path: Path to save the file locally
+            object_size: Size of the object in bytes
+            etag: ETag of the object version being downloaded
+        """
+        try:
+            with open(local_file_path, 'wb') as file:
+                fd = file.fileno()
+                os.ftruncate(fd, object_size)
+                
+                def download_range(start: int):
+                    end = min(start + RANGED_DOWNLOAD_CHUNK_SIZE, object_size) - 1
+                    with self._request_slots.slot():
+                        response = self.object_storage_client.get_object(
+                            namespace_name=self.namespace,
+                            bucket_name=self.bucket_name,
+                            object_name=object_name,
+                            range=f"bytes={start}-{end}",
+                            if_match=etag
+                        )
+                        offset = start
+                        for chunk in response.data.raw.stream(DOWNLOAD_STREAM_CHUNK_SIZE, decode_content=False):
+                            os.pwrite(fd, chunk, offset)
+                            offset += len(chunk)
+                    # A short body would otherwise leave a zero-filled hole
+                    if offset != end + 1:
+                        raise ConnectionError(
+                            f"Range {start}-{end} ended after {offset - start} bytes"
+                        )
+                
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                    futures = [
+                        executor.submit(download_range, start)
+                        for start in range(0, object_size, RANGED_DOWNLOAD_CHUNK_SIZE)
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                    except Exception:
+                        # Stop issuing the remaining ranges once one fails
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        raise
+        except Exception:
+            # The pre-sized file would look complete while containing zero-filled holes
+            Path(local_file_path).unlink(missing_ok=True)
+            raise
+
+
+def _dispatch_request(uploader: OracleObjectStorageUploader, request: dict) -> dict:
+    """
+    Run a single daemon request against an uploader
+    
+    Requests use the CLI argument names, e.g.
+    {"action": "upload-file", "local_path": "...", "object_name": "..."}
+    
+    Returns:
+        dict: Response with an 'ok' flag and, for upload-dir, the upload statistics
+    """
+    action = request.get('action')
+    
+    if action == 'upload-file':
+        return {'ok': uploader.upload_file(request['local_path'], request.get('object_name'))}
+    
+    if action == 'upload-dir':
+        stats = uploader.upload_directory(request['local_path'], request.get('object_prefix', ''))
+        if stats is None:
+            return {'ok': False}
+        return {'ok': stats['failed_count'] == 0, 'stats': stats}
+    
+    if action == 'download':
+        return {'ok': uploader.download_file(request['object_name'], request['local_path'])}
+    
+    return {'ok': False, 'error': f"Unsupported action: {action}"}
+
+
+def serve_daemon(uploader: OracleObjectStorageUploader, socket_path: str):
+    """
+    Serve newline-delimited JSON requests on a Unix socket until interrupted
+    
+    All requests share the uploader's client and connection pool, and run on
+    one thread pool bounded by the uploader's max_concurrency.
+    
+    Args:
+        uploader: Connected uploader used for every request
+        socket_path: Path of the Unix socket to listen on
+    """
+    # Only replace a stale socket; never delete some other file at the path
+    try:
+        existing_mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(existing_mode):
+            raise FileExistsError(f"Refusing to replace non-socket file at {socket_path}")
+        os.unlink(socket_path)
+    
+    executor = ThreadPoolExecutor(max_workers=uploader.max_concurrency)
+    
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    response = executor.submit(_dispatch_request, uploader, request).result()
+                except Exception as e:
+                    response = {'ok': False, 'error': str(e)}
+                self.wfile.write(json.dumps(response).encode() + b'\n')
+                self.wfile.flush()
+    
+    server = socketserver.ThreadingUnixStreamServer(socket_path, RequestHandler)
+    server.daemon_threads = True
+    logger.info(f"Daemon listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Daemon shutting down")
+    finally:
+        server.server_close()
+        executor.shutdown(wait=True)
+        os.unlink(socket_path)
+
+
+def run_client(socket_path: str, request_lines=sys.stdin) -> bool:
+    """
+    Forward newline-delimited JSON requests to a running daemon
+    
+    Each response line is printed to stdout as it arrives.
+    
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        request_lines: Iterable of JSON request lines (defaults to stdin)
+    
+    Returns:
+        bool: True if every request succeeded, False otherwise
+    """
+    all_ok = True
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        responses = sock.makefile('r')
+        for line in request_lines:
+            if not line.strip():
+                continue
+            sock.sendall(line.rstrip('\n').encode() + b'\n')
+            response = responses.readline()
+            if not response:
+                logger.error("Daemon closed the connection")
+                return False
+            print(response, end='', flush=True)
+            all_ok = all_ok and json.loads(response).get('ok', False)
+    return all_ok
 
 
 def main():
@@ -202,7 +839,7 @@ def main():
     )
     parser.add_argument(
         'action',
-        choices=['upload-file', 'upload-dir', 'list', 'download'],
+        choices=['upload-file', 'upload-dir', 'list', 'download', 'daemon', 'client'],
         help='Action to perform'
     )
     parser.add_argument(
@@ -239,9 +876,42 @@ def main():
         default='',
         help='Prefix for objects (for directory uploads)'
     )
+    parser.add_argument(
+        '--output-csv',
+        help='Write the object listing to this CSV file (for list action)'
+    )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f'Maximum number of parallel transfers (default: {DEFAULT_MAX_CONCURRENCY})'
+    )
+    
+    parser.add_argument(
+        '--adaptive-concurrency',
+        action='store_true',
+        help='Tune directory upload concurrency from measured throughput, up to --max-concurrency'
+    )
+    parser.add_argument(
+        '--assume-bucket-exists',
+        action='store_true',
+        help='Skip the bucket existence check on startup'
+    )
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET_PATH,
+        help=f'Unix socket path for the daemon and client actions (default: {DEFAULT_SOCKET_PATH})'
+    )
     
     args = parser.parse_args()
     
+    if args.action == 'client':
+        try:
+            sys.exit(0 if run_client(args.socket) else 1)
+        except OSError as e:
+            logger.error(f"Failed to connect to daemon at {args.socket}: {e}")
+            sys.exit(1)
+    
     # Get namespace from argument or environment variable
     namespace = args.namespace or os.getenv('OCI_NAMESPACE')
     if not namespace:
@@ -260,7 +930,12 @@ def main():
             'profile': args.profile
         }
         
-        uploader = OracleObjectStorageUploader(config, namespace, bucket_name)
+        uploader = OracleObjectStorageUploader(
+            config, namespace, bucket_name,
+            max_concurrency=args.max_concurrency,
+            assume_exists=args.assume_bucket_exists,
+            adaptive_concurrency=args.adaptive_concurrency
+        )
         
         if args.action == 'upload-file':
             if not args.local_path:
@@ -278,7 +953,7 @@ def main():
             sys.exit(0 if stats['failed_count'] == 0 else 1)
         
         elif args.action == 'list':
-            uploader.list_objects(args.object_prefix)
+            uploader.list_objects(args.object_prefix, args.output_csv)
         
         elif args.action == 'download':
             if not args.object_name or not args.local_path:
@@ -286,6 +961,9 @@ def main():
                 sys.exit(1)
             success = uploader.download_file(args.object_name, args.local_path)
             sys.exit(0 if success else 1)
+        
+        elif args.action == 'daemon':
+            serve_daemon(uploader, args.socket)
     
     except Exception as e:
         logger.error(f"Application error: {e}")